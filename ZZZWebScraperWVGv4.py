@@ -1,93 +1,122 @@
-from playwright.sync_api import sync_playwright
-import pandas as pd
-import time
-
-def scrape_dmz(page):
-    print("Scraping DMZ Startup Directory...")
-    data = []
-    page.goto("https://dmz.torontomu.ca/startup-directory", timeout=60000)
-    page.wait_for_load_state("networkidle")  # Wait for page to fully load instead of specific selector
-
-    startup_cards = page.query_selector_all("a.card")
-    for card in startup_cards:
-        name = card.query_selector("h3.card-title").inner_text().strip()
-        link = card.get_attribute("href")
-
-        if link.startswith("/"):
-            link = "https://dmz.torontomu.ca" + link
-
-        # Visit detail page
-        page.goto(link, timeout=60000)
-        time.sleep(1)
-        founders = []
-
-        founder_elements = page.query_selector_all("p, li, span, div")
-        for el in founder_elements:
-            text = el.inner_text().strip()
-            if "Founder" in text or "Co-Founder" in text:
-                founders.append(text)
-
-        data.append({"Startup Name": name, "Founders": ", ".join(set(founders))})
-
-        # Go back to directory
-        page.goto("https://dmz.torontomu.ca/startup-directory", timeout=60000)
-        page.wait_for_selector("h3.card-title")
-
-    return data
-
-
-def scrape_velocity(page):
-    print("Scraping Velocity Incubator...")
-    data = []
-    page.goto("https://velocityincubator.com/companies/", timeout=60000)
-    time.sleep(10)  # Simple wait instead of waiting for specific state
-
-    startup_cards = page.query_selector_all("div")  # Use generic div selector since specific class doesn't exist
-    for card in startup_cards:
-        name_el = card.query_selector("h3")
-        link_el = card.query_selector("a")
-        if not name_el or not link_el:
-            continue
-
-        name = name_el.inner_text().strip()
-        link = link_el.get_attribute("href")
-
-        # Visit detail page
-        page.goto(link, timeout=60000)
-        time.sleep(1)
-        founders = []
-
-        founder_elements = page.query_selector_all("p, li, span, div")
-        for el in founder_elements:
-            text = el.inner_text().strip()
-            if "Founder" in text or "Co-Founder" in text:
-                founders.append(text)
-
-        data.append({"Startup Name": name, "Founders": ", ".join(set(founders))})
-
-        # Go back to main page
-        page.goto("https://velocityincubator.com/companies/", timeout=60000)
-        page.wait_for_selector("div.company-item")
-
-    return data
-
-
-def main():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        dmz_data = scrape_dmz(page)
-        velocity_data = scrape_velocity(page)
-
-        browser.close()
-
-        # Combine results and save to Excel
-        all_data = dmz_data + velocity_data
-        df = pd.DataFrame(all_data)
-        df.to_csv("WVG Tech Week - Founders List.csv", index=False)
-        print("✅ Scraping complete! Saved to startups_dmz_velocity.xlsx")
-
-print("Starting Waterloo Region Startup Founder Scraping.")
-print("======================================================================")
-main()
\ No newline at end of file
+from playwright.async_api import async_playwright
+from selectolax.lexbor import LexborHTMLParser
+import httpx
+import pandas as pd
+import asyncio
+
+# Neither site's text needs images, video, fonts or styling; blocking
+# them cuts most of the per-page transfer
+_BLOCKED_RESOURCES = {"image", "media", "font", "stylesheet"}
+
+
+async def _block_heavy(route):
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _fetch_founders(client, sem, url):
+    """Fetch one detail page over plain HTTP and pull its founder lines"""
+    async with sem:
+        try:
+            resp = await client.get(url)
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"Error fetching {url}: {e}")
+            return []
+    tree = LexborHTMLParser(resp.text)
+    return [text for text in (node.text().strip() for node in tree.css("p, li, span, div"))
+            if "Founder" in text or "Co-Founder" in text]
+
+async def scrape_dmz(page):
+    print("Scraping DMZ Startup Directory...")
+    data = []
+    await page.goto("https://dmz.torontomu.ca/startup-directory", timeout=60000)
+    await page.wait_for_load_state("networkidle")  # Wait for page to fully load instead of specific selector
+
+    startup_cards = await page.query_selector_all("a.card")
+    cards = []
+    for card in startup_cards:
+        name_el = await card.query_selector("h3.card-title")
+        name = (await name_el.inner_text()).strip()
+        link = await card.get_attribute("href")
+
+        if link.startswith("/"):
+            link = "https://dmz.torontomu.ca" + link
+        cards.append((name, link))
+
+    # The detail pages are static HTML; fetch them concurrently over
+    # HTTP/2 instead of navigating the browser through each one
+    sem = asyncio.Semaphore(10)
+    async with httpx.AsyncClient(http2=True, timeout=30.0, follow_redirects=True) as client:
+        founder_lists = await asyncio.gather(
+            *(_fetch_founders(client, sem, link) for _, link in cards))
+
+    for (name, _), founders in zip(cards, founder_lists):
+        data.append({"Startup Name": name, "Founders": ", ".join(set(founders))})
+
+    return data
+
+
+async def scrape_velocity(page):
+    print("Scraping Velocity Incubator...")
+    data = []
+    await page.goto("https://velocityincubator.com/companies/", timeout=60000)
+    await page.wait_for_load_state("networkidle")
+
+    cards = []
+    startup_cards = await page.query_selector_all("div")  # Use generic div selector since specific class doesn't exist
+    for card in startup_cards:
+        name_el = await card.query_selector("h3")
+        link_el = await card.query_selector("a")
+        if not name_el or not link_el:
+            continue
+
+        name = (await name_el.inner_text()).strip()
+        link = await link_el.get_attribute("href")
+        cards.append((name, link))
+
+    for name, link in cards:
+        # Visit detail page
+        await page.goto(link, timeout=60000)
+        # One evaluate filters founder lines in the browser instead of an
+        # inner_text round trip per element
+        founders = await page.evaluate(
+            """() => Array.from(document.querySelectorAll('p, li, span, div'))
+                .map(e => e.innerText.trim())
+                .filter(t => t.includes('Founder') || t.includes('Co-Founder'))""")
+
+        data.append({"Startup Name": name, "Founders": ", ".join(set(founders))})
+
+    return data
+
+
+async def main():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        # One context per site so the two scrapes can run concurrently on
+        # the same browser process
+        context_a = await browser.new_context()
+        context_b = await browser.new_context()
+        await context_a.route("**/*", _block_heavy)
+        await context_b.route("**/*", _block_heavy)
+        page_a = await context_a.new_page()
+        page_b = await context_b.new_page()
+
+        dmz_data, velocity_data = await asyncio.gather(
+            scrape_dmz(page_a),
+            scrape_velocity(page_b)
+        )
+
+        await browser.close()
+
+        # Combine results and save to Excel
+        all_data = dmz_data + velocity_data
+        df = pd.DataFrame(all_data)
+        df.to_csv("WVG Tech Week - Founders List.csv", index=False)
+        print("✅ Scraping complete! Saved to startups_dmz_velocity.xlsx")
+
+print("Starting Waterloo Region Startup Founder Scraping.")
+print("======================================================================")
+asyncio.run(main())
@@ -1,541 +1,733 @@
-"""
-Velocity Incubator Web Scraper
-===============================
-
-A comprehensive web scraping bot using Playwright and pandas to gather startup data
-from the Velocity incubator website and LinkedIn. Extracts company names, founder names,
-and founder LinkedIn profile URLs for companies founded in 2023 or later.
-
-Requirements:
-- playwright
-- pandas
-- openpyxl
-
-Install with: pip install playwright pandas openpyxl
-Then run: playwright install
-"""
-
-import asyncio
-import re
-import time
-from typing import List, Dict, Optional
-import pandas as pd
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
-import logging
-
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-
-class VelocityLinkedInScraper:
-    """Main scraper class for extracting startup data from Velocity and LinkedIn."""
-    
-    def __init__(self, headless: bool = False):
-        self.headless = headless
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.companies_data: List[Dict] = []
-        
-    async def __aenter__(self):
-        """Async context manager entry."""
-        await self.setup_browser()
-        return self
-        
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.cleanup()
-        
-    async def setup_browser(self):
-        """Initialize Playwright browser and context."""
-        logger.info("Setting up browser...")
-        self.playwright = await async_playwright().start()
-        
-        # Use Chromium with realistic user agent
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage'
-            ]
-        )
-        
-        # Try to load saved LinkedIn session
-        storage_state = None
-        try:
-            import json
-            with open('linkedin_session.json', 'r') as f:
-                storage_state = json.load(f)
-            logger.info("✅ Loaded saved LinkedIn session")
-        except FileNotFoundError:
-            logger.warning("⚠️ No LinkedIn session found. LinkedIn features may not work.")
-            logger.info("💡 Run 'python capture_linkedin_session.py' to set up LinkedIn access")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not load LinkedIn session: {e}")
-        
-        self.context = await self.browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-            storage_state=storage_state  # This loads the saved session
-        )
-        
-    async def cleanup(self):
-        """Clean up browser resources."""
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
-            
-    async def wait_for_page_load(self, page: Page, timeout: int = 30000):
-        """Wait for page to fully load with multiple strategies."""
-        try:
-            await page.wait_for_load_state('networkidle', timeout=timeout)
-            await asyncio.sleep(1)  # Additional buffer
-        except Exception as e:
-            logger.warning(f"Network idle timeout, continuing: {e}")
-            await page.wait_for_load_state('domcontentloaded', timeout=10000)
-            
-    async def extract_velocity_join_year(self, page: Page) -> Optional[int]:
-        """Extract year company joined Velocity program from company page."""
-        # Look for Velocity-specific join year indicators
-        join_year_selectors = [
-            'text=/year joined/i',
-            'text=/joined.*202[3-5]/i',  # Specifically look for 2023-2025
-            'text=/velocity.*202[3-5]/i',
-            '[class*="year"]',
-            '[class*="joined"]'
-        ]
-        
-        # First, try to find explicit "Year joined" information
-        for selector in join_year_selectors:
-            try:
-                elements = await page.locator(selector).all()
-                for element in elements:
-                    text = await element.text_content()
-                    if text and ('joined' in text.lower() or 'velocity' in text.lower()):
-                        # Look for years 2023-2025 specifically
-                        years = re.findall(r'\b(202[3-5])\b', text)
-                        if years:
-                            return int(years[0])
-            except Exception:
-                continue
-        
-        # Look for any mention of recent years (2023-2025) in the context of joining/starting
-        try:
-            content = await page.content()
-            
-            # Look for patterns like "Year joined: 2024" or "Joined Velocity in 2023"
-            join_patterns = [
-                r'year\s+joined[:\s]+(\d{4})',
-                r'joined[:\s]+(\d{4})',
-                r'velocity[:\s]+(\d{4})',
-                r'since[:\s]+(\d{4})',
-                r'(\d{4})[:\s]*(?:joined|velocity|program)'
-            ]
-            
-            for pattern in join_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    year = int(match)
-                    if 2023 <= year <= 2025:
-                        return year
-            
-            # Fallback: look for any years 2023-2025 in the content
-            recent_years = re.findall(r'\b(202[3-5])\b', content)
-            if recent_years:
-                # Return the earliest year found (likely join year)
-                return min(int(year) for year in recent_years)
-                
-        except Exception:
-            pass
-            
-        return None
-        
-    async def scrape_velocity_companies(self, max_companies: int = 5) -> List[Dict]:
-        """Main method to scrape companies from Velocity website."""
-        logger.info(f"Starting Velocity website scraping (stopping after {max_companies} successful companies)...")
-        
-        page = await self.context.new_page()
-        
-        try:
-            # Navigate to Velocity companies page
-            logger.info("Navigating to Velocity companies page...")
-            await page.goto('https://www.velocityincubator.com/companies', timeout=60000)
-            await self.wait_for_page_load(page)
-            
-            # Find all company cards/links
-            company_selectors = [
-                'a[href*="/company/"]',
-                'a[href*="/companies/"]',
-                '.company-card a',
-                '[class*="company"] a',
-                'a:has-text("View")',
-                'a:has-text("Company")'
-            ]
-            
-            company_links = []
-            for selector in company_selectors:
-                try:
-                    links = await page.locator(selector).all()
-                    for link in links:
-                        href = await link.get_attribute('href')
-                        if href and ('company' in href.lower() or 'view' in href.lower()):
-                            if href.startswith('/'):
-                                href = f"https://www.velocityincubator.com{href}"
-                            company_links.append(href)
-                    if company_links:
-                        break
-                except Exception:
-                    continue
-            
-            if not company_links:
-                # Fallback: look for any links that might be companies
-                all_links = await page.locator('a').all()
-                for link in all_links:
-                    href = await link.get_attribute('href')
-                    text = await link.text_content()
-                    if href and text and ('company' in text.lower() or 'view' in text.lower()):
-                        if href.startswith('/'):
-                            href = f"https://www.velocityincubator.com{href}"
-                        company_links.append(href)
-            
-            logger.info(f"Found {len(company_links)} potential company links")
-            
-            # Remove duplicates
-            company_links = list(set(company_links))
-            
-            # Process each company until we reach max_companies successful ones
-            successful_companies = 0
-            for i, company_url in enumerate(company_links, 1):
-                if successful_companies >= max_companies:
-                    logger.info(f"✅ Reached target of {max_companies} companies! Stopping scraping.")
-                    break
-                    
-                logger.info(f"Processing company {i}/{len(company_links)} (Success: {successful_companies}/{max_companies}): {company_url}")
-                
-                try:
-                    company_data = await self.process_company(company_url)
-                    if company_data:
-                        self.companies_data.append(company_data)
-                        successful_companies += 1
-                        logger.info(f"✅ Successfully processed ({successful_companies}/{max_companies}): {company_data['Company']}")
-                        
-                        # Save progress incrementally so data isn't lost if interrupted
-                        await self.save_progress()
-                    else:
-                        logger.info(f"⏭️ Skipped company (joined Velocity before 2023): {company_url}")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error processing company {company_url}: {e}")
-                    continue
-                    
-                # Small delay between requests
-                await asyncio.sleep(2)
-                
-        except Exception as e:
-            logger.error(f"Error scraping Velocity companies: {e}")
-            
-        finally:
-            await page.close()
-            
-        return self.companies_data
-        
-    async def process_company(self, company_url: str) -> Optional[Dict]:
-        """Process individual company page."""
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(company_url, timeout=60000)
-            await self.wait_for_page_load(page)
-            
-            # Extract Velocity join year first
-            join_year = await self.extract_velocity_join_year(page)
-            
-            # If we can determine the join year, check if it's 2023 or later
-            if join_year is not None:
-                if join_year < 2023:
-                    logger.info(f"Company joined Velocity in {join_year} (before 2023) - skipping")
-                    await page.close()
-                    return None
-                else:
-                    logger.info(f"Company joined Velocity in {join_year} - proceeding with extraction")
-            else:
-                # If we can't determine join year, include it anyway (better to be inclusive)
-                logger.info(f"Could not determine Velocity join year - including company anyway")
-            
-            # Extract company name
-            company_name = await self.extract_company_name(page)
-            
-            # Extract founders
-            founders = await self.extract_founders(page)
-            
-            # Extract LinkedIn URL
-            linkedin_url = await self.extract_company_linkedin(page)
-            
-            if not company_name:
-                logger.warning("Could not extract company name, skipping")
-                return None
-                
-            company_data = {
-                'Company': company_name,
-                'Founders': founders,
-                'Linkedins': []
-            }
-            
-            # If we have LinkedIn URL and founders, get founder LinkedIn profiles
-            if linkedin_url and founders:
-                founder_linkedins = await self.extract_founder_linkedins(linkedin_url, founders)
-                company_data['Linkedins'] = founder_linkedins
-                
-            return company_data
-            
-        except Exception as e:
-            logger.error(f"Error processing company page {company_url}: {e}")
-            return None
-            
-        finally:
-            await page.close()
-            
-    async def extract_company_name(self, page: Page) -> str:
-        """Extract company name from company page."""
-        name_selectors = [
-            'h1',
-            '.company-name',
-            '[class*="company"][class*="name"]',
-            '[class*="title"]',
-            'title'
-        ]
-        
-        for selector in name_selectors:
-            try:
-                element = await page.locator(selector).first
-                if element:
-                    text = await element.text_content()
-                    if text and len(text.strip()) > 0:
-                        return text.strip()
-            except Exception:
-                continue
-                
-        # Fallback: extract from page title
-        try:
-            title = await page.title()
-            if title and '|' in title:
-                return title.split('|')[0].strip()
-            elif title:
-                return title.strip()
-        except Exception:
-            pass
-            
-        return "Unknown Company"
-        
-    async def extract_founders(self, page: Page) -> List[str]:
-        """Extract founder names from company page."""
-        founders = []
-        
-        founder_selectors = [
-            'text=/founder/i',
-            'text=/co-founder/i',
-            'text=/ceo/i',
-            '[class*="founder"]',
-            '[class*="team"]',
-            '[class*="leadership"]'
-        ]
-        
-        for selector in founder_selectors:
-            try:
-                elements = await page.locator(selector).all()
-                for element in elements:
-                    text = await element.text_content()
-                    if text:
-                        # Extract names using patterns
-                        names = self.extract_names_from_text(text)
-                        founders.extend(names)
-            except Exception:
-                continue
-                
-        # Remove duplicates and clean up
-        founders = list(set([name.strip() for name in founders if name.strip()]))
-        return founders
-        
-    def extract_names_from_text(self, text: str) -> List[str]:
-        """Extract person names from text using patterns."""
-        names = []
-        
-        # Pattern for names (First Last, possibly with middle initial)
-        name_pattern = r'\b([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+)\b'
-        matches = re.findall(name_pattern, text)
-        
-        for match in matches:
-            # Filter out common false positives
-            if not any(word in match.lower() for word in ['company', 'inc', 'llc', 'corp', 'ltd']):
-                names.append(match)
-                
-        return names
-        
-    async def extract_company_linkedin(self, page: Page) -> Optional[str]:
-        """Extract company LinkedIn URL from company page."""
-        linkedin_selectors = [
-            'a[href*="linkedin.com/company"]',
-            'a[href*="linkedin.com/in"]',
-            '[href*="linkedin"]'
-        ]
-        
-        for selector in linkedin_selectors:
-            try:
-                elements = await page.locator(selector).all()
-                for element in elements:
-                    href = await element.get_attribute('href')
-                    if href and 'linkedin.com/company' in href:
-                        return href
-            except Exception:
-                continue
-                
-        return None
-        
-    async def extract_founder_linkedins(self, company_linkedin_url: str, founders: List[str]) -> List[str]:
-        """Extract founder LinkedIn profiles from company LinkedIn page."""
-        if not company_linkedin_url or not founders:
-            return []
-            
-        page = await self.context.new_page()
-        founder_linkedins = []
-        
-        try:
-            logger.info(f"Navigating to LinkedIn: {company_linkedin_url}")
-            await page.goto(company_linkedin_url, timeout=60000)
-            await self.wait_for_page_load(page)
-            
-            # Try to click on People tab
-            people_selectors = [
-                'a:has-text("People")',
-                'button:has-text("People")',
-                '[data-control-name*="people"]',
-                'text=/people/i'
-            ]
-            
-            people_clicked = False
-            for selector in people_selectors:
-                try:
-                    people_tab = await page.locator(selector).first
-                    if people_tab:
-                        await people_tab.click()
-                        await self.wait_for_page_load(page)
-                        people_clicked = True
-                        break
-                except Exception:
-                    continue
-                    
-            if not people_clicked:
-                logger.warning("Could not find or click People tab")
-                return []
-                
-            # Look for founder profiles
-            for founder in founders:
-                try:
-                    # Search for founder name in various ways
-                    founder_selectors = [
-                        f'a:has-text("{founder}")',
-                        f'[title*="{founder}"]',
-                        f'text=/{re.escape(founder)}/i'
-                    ]
-                    
-                    for selector in founder_selectors:
-                        try:
-                            elements = await page.locator(selector).all()
-                            for element in elements:
-                                href = await element.get_attribute('href')
-                                if href and 'linkedin.com/in/' in href:
-                                    founder_linkedins.append(href)
-                                    logger.info(f"Found LinkedIn for {founder}: {href}")
-                                    break
-                        except Exception:
-                            continue
-                            
-                except Exception as e:
-                    logger.warning(f"Error finding LinkedIn for {founder}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error extracting founder LinkedIns: {e}")
-            
-        finally:
-            await page.close()
-            
-        return list(set(founder_linkedins))  # Remove duplicates
-        
-    async def save_progress(self):
-        """Save current progress to avoid losing data on interruption."""
-        if not self.companies_data:
-            return
-            
-        try:
-            import json
-            progress_filename = 'velocity_scraper_progress.json'
-            with open(progress_filename, 'w', encoding='utf-8') as f:
-                json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"💾 Progress saved: {len(self.companies_data)} companies")
-        except Exception as e:
-            logger.error(f"Failed to save progress: {e}")
-        
-    def export_to_excel(self, filename: str = 'velocity_startups_data.xlsx'):
-        """Export collected data to Excel file."""
-        if not self.companies_data:
-            logger.warning("No data to export")
-            return
-            
-        logger.info(f"Exporting {len(self.companies_data)} companies to {filename}")
-        
-        # Prepare data for DataFrame
-        export_data = []
-        for company in self.companies_data:
-            # Convert lists to strings for Excel export
-            founders_str = '; '.join(company['Founders']) if company['Founders'] else ''
-            linkedins_str = '; '.join(company['Linkedins']) if company['Linkedins'] else ''
-            
-            export_data.append({
-                'Company': company['Company'],
-                'Founders': founders_str,
-                'Linkedins': linkedins_str
-            })
-            
-        # Create DataFrame and export
-        df = pd.DataFrame(export_data)
-        df.to_excel(filename, index=False, engine='openpyxl')
-        logger.info(f"Data exported successfully to {filename}")
-        
-        # Also save as JSON for backup
-        import json
-        json_filename = filename.replace('.xlsx', '.json')
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Backup JSON saved to {json_filename}")
-
-
-async def main():
-    """Main execution function."""
-    logger.info("Starting Velocity LinkedIn Scraper...")
-    
-    async with VelocityLinkedInScraper(headless=False) as scraper:
-        # Scrape companies data (limit to 5 successful companies)
-        companies_data = await scraper.scrape_velocity_companies(max_companies=5)
-        
-        # Export results
-        scraper.export_to_excel()
-        
-        # Print summary
-        logger.info(f"\n{'='*50}")
-        logger.info(f"SCRAPING COMPLETED")
-        logger.info(f"{'='*50}")
-        logger.info(f"Total companies processed: {len(companies_data)}")
-        
-        for i, company in enumerate(companies_data, 1):
-            logger.info(f"\n{i}. {company['Company']}")
-            logger.info(f"   Founders: {', '.join(company['Founders']) if company['Founders'] else 'None found'}")
-            logger.info(f"   LinkedIn profiles: {len(company['Linkedins'])} found")
-
-
-if __name__ == "__main__":
+"""
+Velocity Incubator Web Scraper
+===============================
+
+A comprehensive web scraping bot using Playwright and pandas to gather startup data
+from the Velocity incubator website and LinkedIn. Extracts company names, founder names,
+and founder LinkedIn profile URLs for companies founded in 2023 or later.
+
+Requirements:
+- playwright
+- pandas
+- openpyxl
+
+Install with: pip install playwright pandas openpyxl
+Then run: playwright install
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import time
+from functools import lru_cache
+from typing import List, Dict, Optional
+import httpx
+from openpyxl import Workbook
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from selectolax.lexbor import LexborHTMLParser
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Resource types the scraper never reads; stylesheets are handled
+# separately because LinkedIn misbehaves without them
+_BLOCKED_RESOURCES = {'image', 'media', 'font'}
+
+# Analytics/tracking endpoints that only add latency
+_TRACKER_HOSTS = (
+    'doubleclick.net',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'hotjar.com',
+    'linkedin.com/li/track'
+)
+
+# Compiled once; these run against every company page
+_JOIN_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'year\s+joined[:\s]+(\d{4})',
+    r'joined[:\s]+(\d{4})',
+    r'velocity[:\s]+(\d{4})',
+    r'since[:\s]+(\d{4})',
+    r'(\d{4})[:\s]*(?:joined|velocity|program)'
+)]
+_YEAR_RE = re.compile(r'\b(202[3-5])\b')
+# First Last, possibly with a middle initial
+_NAME_RE = re.compile(r'\b([A-Z][a-z]+ (?:[A-Z]\. )?[A-Z][a-z]+)\b')
+# Matches that are organisation words, not people
+_BAD_TOKEN_RE = re.compile(r'\b(company|inc|llc|corp|ltd)\b', re.IGNORECASE)
+
+
+class _Cache:
+    """Small sqlite-backed page cache so reruns skip unchanged pages."""
+    
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, fetched_at INTEGER, html BLOB)')
+        
+    def get(self, url: str, ttl: int) -> Optional[str]:
+        row = self._conn.execute(
+            'SELECT fetched_at, html FROM pages WHERE url = ?', (url,)).fetchone()
+        if row and time.time() - row[0] < ttl:
+            return row[1].decode('utf-8')
+        return None
+        
+    def put(self, url: str, html: str):
+        self._conn.execute(
+            'INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+            (url, int(time.time()), html.encode('utf-8')))
+        self._conn.commit()
+        
+    def close(self):
+        self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def _load_session(path: str, mtime: float) -> Dict:
+    """Parse the saved LinkedIn session, cached until the file changes.
+
+    Keyed on mtime so repeated scraper instances in one process skip the
+    re-read and re-parse, while an updated session file still gets picked up.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class VelocityLinkedInScraper:
+    """Main scraper class for extracting startup data from Velocity and LinkedIn."""
+    
+    def __init__(self, headless: bool = False, max_concurrency: int = 5, allow_css: bool = True,
+                 cache_path: str = 'cache.sqlite', cache_ttl: int = 86400):
+        self.headless = headless
+        # Keep stylesheets by default; LinkedIn's People tab needs them,
+        # pure-content runs can turn them off for extra speed
+        self.allow_css = allow_css
+        # Cap on simultaneously open company pages
+        self.max_concurrency = max_concurrency
+        self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
+        self.companies_data: List[Dict] = []
+        # Lines written to the progress log this run
+        self._saved_count = 0
+        # Fetched HTML is reused across runs within cache_ttl seconds
+        self._cache = _Cache(cache_path)
+        self.cache_ttl = cache_ttl
+        
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.setup_browser()
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.cleanup()
+        
+    async def setup_browser(self):
+        """Initialize Playwright browser and context."""
+        logger.info("Setting up browser...")
+        self.playwright = await async_playwright().start()
+        
+        # Use Chromium with realistic user agent
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[
+                '--no-sandbox',
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage'
+            ]
+        )
+        
+        # Try to load saved LinkedIn session
+        storage_state = None
+        try:
+            session_path = 'linkedin_session.json'
+            storage_state = _load_session(session_path, os.stat(session_path).st_mtime)
+            logger.info("✅ Loaded saved LinkedIn session")
+        except FileNotFoundError:
+            logger.warning("⚠️ No LinkedIn session found. LinkedIn features may not work.")
+            logger.info("💡 Run 'python capture_linkedin_session.py' to set up LinkedIn access")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load LinkedIn session: {e}")
+        
+        self.context = await self.browser.new_context(
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            viewport={'width': 1920, 'height': 1080},
+            storage_state=storage_state  # This loads the saved session
+        )
+        
+        # Block the asset classes and trackers we never read
+        await self.context.route("**/*", self._route_filter)
+        
+        # Progress log; one JSON line per completed company
+        self._progress_fp = open('velocity_scraper_progress.jsonl', 'a', encoding='utf-8')
+        
+        # Plain-HTTP client for company pages that turn out to be static
+        self._http = httpx.AsyncClient(
+            http2=True, timeout=30.0, follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})
+        
+        # Pre-open a pool of reusable pages; creating and closing a page
+        # per company is a browser round trip each way. Two per worker:
+        # a company page plus its LinkedIn lookup can be held at once,
+        # and sizing for both avoids starving the pool
+        self._page_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(self.max_concurrency * 2):
+            await self._page_pool.put(await self.context.new_page())
+        
+    async def _route_filter(self, route):
+        """Abort requests for unused assets and tracking endpoints."""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCES:
+            await route.abort()
+        elif request.resource_type == 'stylesheet' and not self.allow_css:
+            await route.abort()
+        elif any(host in request.url for host in _TRACKER_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+        
+    async def _acquire_page(self) -> Page:
+        """Take a page from the pool, waiting if all are in use."""
+        return await self._page_pool.get()
+        
+    async def _release_page(self, page: Page):
+        """Reset a page and return it to the pool."""
+        try:
+            await page.goto('about:blank')
+        except Exception:
+            # Page died; replace it so the pool keeps its size
+            page = await self.context.new_page()
+        await self._page_pool.put(page)
+        
+    async def cleanup(self):
+        """Clean up browser resources."""
+        if hasattr(self, '_progress_fp'):
+            self._progress_fp.close()
+        self._cache.close()
+        if hasattr(self, '_http'):
+            await self._http.aclose()
+        if hasattr(self, '_page_pool'):
+            while not self._page_pool.empty():
+                await self._page_pool.get_nowait().close()
+        if self.context:
+            await self.context.close()
+        if self.browser:
+            await self.browser.close()
+        if hasattr(self, 'playwright'):
+            await self.playwright.stop()
+            
+    async def wait_for_page_load(self, page: Page, selector: Optional[str] = None, timeout: int = 10000):
+        """Wait for the DOM, then optionally for a selector we actually read.
+        
+        networkidle plus a fixed sleep stalled every navigation for seconds;
+        waiting on the element the caller needs returns as soon as it exists.
+        """
+        try:
+            await page.wait_for_load_state('domcontentloaded', timeout=timeout)
+            if selector:
+                await page.wait_for_selector(selector, timeout=5000)
+        except Exception as e:
+            logger.warning(f"Page load wait timed out, continuing: {e}")
+            
+    async def extract_velocity_join_year(self, page: Optional[Page], page_text: Optional[str] = None) -> Optional[int]:
+        """Extract year company joined Velocity program from company page.
+        
+        page may be None on the plain-HTTP path, in which case only the
+        text scan runs.
+        """
+        # Look for Velocity-specific join year indicators
+        join_year_selectors = [
+            'text=/year joined/i',
+            'text=/joined.*202[3-5]/i',  # Specifically look for 2023-2025
+            'text=/velocity.*202[3-5]/i',
+            '[class*="year"]',
+            '[class*="joined"]'
+        ] if page is not None else []
+        
+        # First, try to find explicit "Year joined" information
+        for selector in join_year_selectors:
+            try:
+                elements = await page.locator(selector).all()
+                for element in elements:
+                    text = await element.text_content()
+                    if text and ('joined' in text.lower() or 'velocity' in text.lower()):
+                        # Look for years 2023-2025 specifically
+                        years = _YEAR_RE.findall(text)
+                        if years:
+                            return int(years[0])
+            except Exception:
+                continue
+        
+        # Look for any mention of recent years (2023-2025) in the context of joining/starting
+        try:
+            # The year lives in visible text; innerText is far smaller than
+            # the serialized DOM that page.content() returns
+            if page_text is None:
+                # Cheap existence probe before pulling the whole body text
+                if not await page.locator('text=/202[3-5]/').count():
+                    return None
+                page_text = await page.evaluate("() => document.body ? document.body.innerText : ''")
+            content = page_text
+            
+            # Look for patterns like "Year joined: 2024" or "Joined Velocity in 2023"
+            for pattern in _JOIN_PATTERNS:
+                matches = pattern.findall(content)
+                for match in matches:
+                    year = int(match)
+                    if 2023 <= year <= 2025:
+                        return year
+            
+            # Fallback: look for any years 2023-2025 in the content
+            recent_years = _YEAR_RE.findall(content)
+            if recent_years:
+                # Return the earliest year found (likely join year)
+                return min(int(year) for year in recent_years)
+                
+        except Exception:
+            pass
+            
+        return None
+        
+    async def scrape_velocity_companies(self, max_companies: int = 5) -> List[Dict]:
+        """Main method to scrape companies from Velocity website."""
+        logger.info(f"Starting Velocity website scraping (stopping after {max_companies} successful companies)...")
+        
+        page = await self.context.new_page()
+        
+        try:
+            # Navigate to Velocity companies page
+            logger.info("Navigating to Velocity companies page...")
+            await page.goto('https://www.velocityincubator.com/companies', timeout=60000)
+            # The listing is client-rendered; wait for the company links
+            # themselves or the harvest below can run against an empty DOM
+            await self.wait_for_page_load(page, selector='a[href*="/company/"], [class*="company"] a')
+            
+            # Find all company cards/links; one comma-joined query replaces
+            # a locator round trip per selector
+            company_selector = (
+                'a[href*="/company/"], a[href*="/companies/"], .company-card a, '
+                '[class*="company"] a, a:has-text("View"), a:has-text("Company")')
+            
+            # Dedupe while collecting so page order (and therefore output
+            # order) stays deterministic across runs
+            company_links = []
+            seen_links = set()
+            try:
+                links = await page.locator(company_selector).all()
+                for link in links:
+                    href = await link.get_attribute('href')
+                    if href and ('company' in href.lower() or 'view' in href.lower()):
+                        if href.startswith('/'):
+                            href = f"https://www.velocityincubator.com{href}"
+                        if href not in seen_links:
+                            seen_links.add(href)
+                            company_links.append(href)
+            except Exception:
+                pass
+            
+            if not company_links:
+                # Fallback: look for any links that might be companies
+                all_links = await page.locator('a').all()
+                for link in all_links:
+                    href = await link.get_attribute('href')
+                    text = await link.text_content()
+                    if href and text and ('company' in text.lower() or 'view' in text.lower()):
+                        if href.startswith('/'):
+                            href = f"https://www.velocityincubator.com{href}"
+                        if href not in seen_links:
+                            seen_links.add(href)
+                            company_links.append(href)
+            
+            logger.info(f"Found {len(company_links)} potential company links")
+            
+            # Process companies concurrently, a semaphore keeping at most
+            # max_concurrency pages open at once. Only gather a bounded
+            # slice: headroom for skipped/failed companies without
+            # scraping (and hitting LinkedIn for) the whole directory
+            # just to keep the first few results
+            hard_cap = max_companies * 4
+            company_links = company_links[:hard_cap]
+            sem = asyncio.Semaphore(self.max_concurrency)
+            successes = 0
+            
+            async def _one(company_url: str) -> Optional[Dict]:
+                nonlocal successes
+                async with sem:
+                    if successes >= max_companies:
+                        # Target already reached; don't start more work
+                        return None
+                    logger.info(f"Processing company: {company_url}")
+                    company_data = await self.process_company(company_url)
+                    if company_data is None:
+                        return None
+                    if successes >= max_companies:
+                        # A concurrent worker hit the target while this ran;
+                        # drop the result so the progress log matches the
+                        # exported data
+                        return None
+                    successes += 1
+                    # Log progress as each company finishes, not after the
+                    # whole gather, so an interrupt loses nothing
+                    await self.save_progress(company_data)
+                    return company_data
+            
+            results = await asyncio.gather(*(_one(url) for url in company_links),
+                                           return_exceptions=True)
+            
+            successful_companies = 0
+            for company_url, company_data in zip(company_links, results):
+                if isinstance(company_data, Exception):
+                    logger.error(f"❌ Error processing company {company_url}: {company_data}")
+                    continue
+                if company_data is None:
+                    logger.info(f"⏭️ Skipped company (joined Velocity before 2023): {company_url}")
+                    continue
+                
+                self.companies_data.append(company_data)
+                successful_companies += 1
+                logger.info(f"✅ Successfully processed ({successful_companies}/{max_companies}): {company_data['Company']}")
+                
+                if successful_companies >= max_companies:
+                    logger.info(f"✅ Reached target of {max_companies} companies! Keeping the first {max_companies}.")
+                    break
+                
+        except Exception as e:
+            logger.error(f"Error scraping Velocity companies: {e}")
+            
+        finally:
+            await page.close()
+            
+        return self.companies_data
+        
+    async def _fast_fetch(self, url: str) -> Optional[Dict]:
+        """Fetch a company page over plain HTTP and build the snapshot dict.
+        
+        Most company pages are static; skipping the browser for them frees
+        the page pool for the ones that aren't. Returns None when the fetch
+        fails or the response has no LinkedIn anchor, which usually means
+        the content is rendered client side and needs Playwright.
+        """
+        # Raw-HTTP and rendered HTML live under separate cache keys:
+        # handing a client-rendered page's static HTML to set_content
+        # would give the browser fallback a DOM whose scripts never ran
+        html = self._cache.get('http:' + url, self.cache_ttl)
+        fetched = html is None
+        if fetched:
+            try:
+                resp = await self._http.get(url)
+                resp.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.warning(f"HTTP fetch failed for {url}, falling back to browser: {e}")
+                return None
+            html = resp.text
+            
+        tree = LexborHTMLParser(html)
+        linkedin = [node.attributes.get('href') for node in tree.css('a[href*="linkedin.com"]')
+                    if node.attributes.get('href')]
+        if not linkedin:
+            # No LinkedIn anchor is the needs-browser signal; caching this
+            # HTML would only poison the browser path
+            return None
+        if fetched:
+            self._cache.put('http:' + url, html)
+            
+        name = ''
+        for sel in ('h1', '.company-name', '[class*="company"][class*="name"]', '[class*="title"]'):
+            node = tree.css_first(sel)
+            if node and node.text(strip=True):
+                name = node.text(strip=True)
+                break
+                
+        team_text = '\n'.join(
+            node.text(separator=' ')
+            for sel in ('[class*="founder"]', '[class*="team"]', '[class*="leadership"]')
+            for node in tree.css(sel))
+        body = tree.css_first('body')
+        return {
+            'name': name,
+            'linkedin': linkedin,
+            'rawText': body.text(separator='\n') if body else '',
+            'teamText': team_text
+        }
+        
+    async def process_company(self, company_url: str) -> Optional[Dict]:
+        """Process individual company page."""
+        # Try plain HTTP first and only fall back to a pooled browser page
+        snapshot = await self._fast_fetch(company_url)
+        page = None
+        
+        try:
+            if snapshot is not None:
+                join_year = await self.extract_velocity_join_year(None, snapshot['rawText'])
+                founders = list(dict.fromkeys(
+                    name.strip() for name in self.extract_names_from_text(snapshot['teamText'])
+                    if name.strip()))
+            else:
+                page = await self._acquire_page()
+                # Only HTML that came from a previous page.content() is
+                # safe to inject with set_content
+                cached = self._cache.get('rendered:' + company_url, self.cache_ttl)
+                if cached is not None:
+                    await page.set_content(cached)
+                else:
+                    await page.goto(company_url, timeout=60000)
+                    await self.wait_for_page_load(page, selector='h1')
+                    self._cache.put('rendered:' + company_url, await page.content())
+                
+                # One snapshot feeds the join-year, name and LinkedIn extractors
+                snapshot = await self._snapshot_page(page)
+                
+                # The join-year check and founder extraction hit the page
+                # independently; run them concurrently instead of back to back
+                join_year, founders = await asyncio.gather(
+                    self.extract_velocity_join_year(page, snapshot['rawText']),
+                    self.extract_founders(page))
+            
+            # If we can determine the join year, check if it's 2023 or later
+            if join_year is not None:
+                if join_year < 2023:
+                    logger.info(f"Company joined Velocity in {join_year} (before 2023) - skipping")
+                    return None
+                else:
+                    logger.info(f"Company joined Velocity in {join_year} - proceeding with extraction")
+            else:
+                # If we can't determine join year, include it anyway (better to be inclusive)
+                logger.info(f"Could not determine Velocity join year - including company anyway")
+            
+            # Extract company name
+            company_name = await self.extract_company_name(page, snapshot)
+            
+            # Extract LinkedIn URL
+            linkedin_url = await self.extract_company_linkedin(page, snapshot)
+            
+            if not company_name:
+                logger.warning("Could not extract company name, skipping")
+                return None
+                
+            company_data = {
+                'Company': company_name,
+                'Founders': founders,
+                'Linkedins': []
+            }
+            
+            # If we have LinkedIn URL and founders, get founder LinkedIn profiles
+            if linkedin_url and founders:
+                founder_linkedins = await self.extract_founder_linkedins(linkedin_url, founders)
+                company_data['Linkedins'] = founder_linkedins
+                
+            return company_data
+            
+        except Exception as e:
+            logger.error(f"Error processing company page {company_url}: {e}")
+            return None
+            
+        finally:
+            if page is not None:
+                await self._release_page(page)
+            
+    async def _snapshot_page(self, page: Page) -> Dict:
+        """Grab name, LinkedIn anchors and body text in one evaluate.
+        
+        The individual extractors used to make a protocol round trip per
+        selector; this collects everything they need in a single call.
+        """
+        return await page.evaluate(
+            """() => {
+                let name = '';
+                for (const sel of ['h1', '.company-name', '[class*=\"company\"][class*=\"name\"]', '[class*=\"title\"]']) {
+                    const el = document.querySelector(sel);
+                    if (el && el.textContent.trim()) { name = el.textContent.trim(); break; }
+                }
+                return {
+                    name: name,
+                    linkedin: Array.from(document.querySelectorAll('a[href*=\"linkedin.com\"]')).map(a => a.href),
+                    rawText: document.body ? document.body.innerText : ''
+                };
+            }""")
+        
+    async def extract_company_name(self, page: Optional[Page], snapshot: Optional[Dict] = None) -> str:
+        """Extract company name from company page."""
+        if snapshot is None:
+            snapshot = await self._snapshot_page(page)
+        if snapshot['name']:
+            return snapshot['name']
+                
+        # Fallback: extract from page title
+        try:
+            if page is None:
+                return "Unknown Company"
+            title = await page.title()
+            if title and '|' in title:
+                return title.split('|')[0].strip()
+            elif title:
+                return title.strip()
+        except Exception:
+            pass
+            
+        return "Unknown Company"
+        
+    async def extract_founders(self, page: Page) -> List[str]:
+        """Extract founder names from company page."""
+        # One evaluate gathers the text of every founder/team/leadership
+        # block; the old per-selector locator loops pulled text element by
+        # element over the protocol
+        try:
+            team_text = await page.evaluate(
+                """(sels) => sels.flatMap(s => Array.from(document.querySelectorAll(s)))
+                    .map(e => e.innerText)
+                    .join('\\n')""",
+                ['[class*="founder"]', '[class*="team"]', '[class*="leadership"]'])
+        except Exception:
+            return []
+            
+        founders = self.extract_names_from_text(team_text)
+        
+        # dict.fromkeys dedupes while keeping page order, so the exported
+        # rows read the same from run to run
+        return list(dict.fromkeys(name.strip() for name in founders if name.strip()))
+        
+    def extract_names_from_text(self, text: str) -> List[str]:
+        """Extract person names from text using patterns."""
+        # One compiled scan per candidate beats lowercasing and substring
+        # checking against five words each time
+        return [match for match in _NAME_RE.findall(text)
+                if not _BAD_TOKEN_RE.search(match)]
+        
+    async def extract_company_linkedin(self, page: Optional[Page], snapshot: Optional[Dict] = None) -> Optional[str]:
+        """Extract company LinkedIn URL from company page."""
+        if snapshot is None:
+            snapshot = await self._snapshot_page(page)
+        for href in snapshot['linkedin']:
+            if 'linkedin.com/company' in href:
+                return href
+                
+        return None
+        
+    async def extract_founder_linkedins(self, company_linkedin_url: str, founders: List[str]) -> List[str]:
+        """Extract founder LinkedIn profiles from company LinkedIn page."""
+        if not company_linkedin_url or not founders:
+            return []
+            
+        page = await self._acquire_page()
+        founder_linkedins = []
+        
+        try:
+            logger.info(f"Navigating to LinkedIn: {company_linkedin_url}")
+            await page.goto(company_linkedin_url, timeout=60000)
+            await self.wait_for_page_load(page, selector='a[href*="linkedin.com/in/"]')
+            
+            # Try to click on People tab; the alternatives union into one
+            # query, so one resolution finds whichever form the page uses
+            people_clicked = False
+            try:
+                people_tab = await page.query_selector(
+                    'a:has-text("People"), button:has-text("People"), [data-control-name*="people"]')
+                if people_tab:
+                    await people_tab.click()
+                    await self.wait_for_page_load(page)
+                    people_clicked = True
+            except Exception:
+                pass
+                    
+            if not people_clicked:
+                logger.warning("Could not find or click People tab")
+                return []
+                
+            # Pull every profile anchor in one evaluate and match founder
+            # names in Python; the per-founder selector loops cost several
+            # protocol round trips per name
+            profile_links = await page.evaluate(
+                """() => Array.from(document.querySelectorAll('a[href*=\"linkedin.com/in/\"]'))
+                    .map(a => ({href: a.href, text: a.innerText, title: a.title}))""")
+            
+            for founder in founders:
+                founder_re = re.compile(re.escape(founder), re.IGNORECASE)
+                for link in profile_links:
+                    if founder_re.search(link['text']) or founder_re.search(link['title']):
+                        founder_linkedins.append(link['href'])
+                        logger.info(f"Found LinkedIn for {founder}: {link['href']}")
+                        break
+                    
+        except Exception as e:
+            logger.error(f"Error extracting founder LinkedIns: {e}")
+            
+        finally:
+            await self._release_page(page)
+            
+        return list(dict.fromkeys(founder_linkedins))  # Remove duplicates, keep order
+        
+    async def save_progress(self, company: Dict):
+        """Append a completed company to the progress log.
+        
+        One JSON line per company means constant work per save instead of
+        rewriting the whole snapshot, and an interrupted run keeps every
+        line that reached disk.
+        """
+        try:
+            self._progress_fp.write(json.dumps(company, ensure_ascii=False) + '\n')
+            self._progress_fp.flush()
+            self._saved_count += 1
+            logger.info(f"💾 Progress saved: {self._saved_count} companies")
+        except Exception as e:
+            logger.error(f"Failed to save progress: {e}")
+        
+    def export_to_excel(self, filename: str = 'velocity_startups_data.xlsx'):
+        """Export collected data to Excel file."""
+        if not self.companies_data:
+            logger.warning("No data to export")
+            return
+            
+        logger.info(f"Exporting {len(self.companies_data)} companies to {filename}")
+        
+        # Write-only workbook streams rows straight to disk instead of
+        # building a DataFrame and an in-memory sheet first
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(['Company', 'Founders', 'Linkedins'])
+        for company in self.companies_data:
+            # Convert lists to strings for Excel export
+            ws.append([
+                company['Company'],
+                '; '.join(company['Founders']) if company['Founders'] else '',
+                '; '.join(company['Linkedins']) if company['Linkedins'] else ''
+            ])
+        wb.save(filename)
+        logger.info(f"Data exported successfully to {filename}")
+        
+        # Also save as JSON for backup
+        json_filename = filename.replace('.xlsx', '.json')
+        with open(json_filename, 'w', encoding='utf-8') as f:
+            json.dump(self.companies_data, f, indent=2, ensure_ascii=False)
+        logger.info(f"Backup JSON saved to {json_filename}")
+
+
+async def main():
+    """Main execution function."""
+    logger.info("Starting Velocity LinkedIn Scraper...")
+    
+    async with VelocityLinkedInScraper(headless=False) as scraper:
+        # Scrape companies data (limit to 5 successful companies)
+        companies_data = await scraper.scrape_velocity_companies(max_companies=5)
+        
+        # Export results
+        scraper.export_to_excel()
+        
+        # Print summary
+        logger.info(f"\n{'='*50}")
+        logger.info(f"SCRAPING COMPLETED")
+        logger.info(f"{'='*50}")
+        logger.info(f"Total companies processed: {len(companies_data)}")
+        
+        for i, company in enumerate(companies_data, 1):
+            logger.info(f"\n{i}. {company['Company']}")
+            logger.info(f"   Founders: {', '.join(company['Founders']) if company['Founders'] else 'None found'}")
+            logger.info(f"   LinkedIn profiles: {len(company['Linkedins'])} found")
+
+
+if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file